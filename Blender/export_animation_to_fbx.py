@@ -9,32 +9,30 @@ bl_info = {
     "category": "Export Animation",
 }
 
+import contextlib
 import os
+import sys
 import bpy
 
-CHARACTER_OPTIONS: list[tuple[str, str, str]] = [
+CHARACTER_OPTIONS: tuple[tuple[str, str, str], ...] = (
     ("Maurice", "Maurice", ""),
     ("Mother_Golem", "Golem Mutter", ""),
     ("Bird", "Vogel", ""),
     ("Test", "Test", ""),
-]
+)
 
-SCENE_OPTIONS: list[tuple[str, str, str]] = [
-    (f"Szene {i:03d}", f"scene{i:03d}", "") for i in range(2, 20)
-]
-SCENE_OPTIONS.append(("Test", "Test", ""))
+SCENE_OPTIONS: tuple[tuple[str, str, str], ...] = tuple(
+    (sys.intern(f"Szene {i:03d}"), sys.intern(f"scene{i:03d}"), "") for i in range(2, 20)
+) + (("Test", "Test", ""),)
 
-bpy.types.Scene.character_selector = bpy.props.EnumProperty(
-    name="Select Character",
-    description="Choose the character for the animation export",
-    items=CHARACTER_OPTIONS,
-)
+BASE_PATH: str = "N:/GOLEMS_FATE/animations"
 
-bpy.types.Scene.scene_selector = bpy.props.EnumProperty(
-    name="Select Scene",
-    description="Choose the scene for the animation export",
-    items=SCENE_OPTIONS,
-)
+# Export directories already created or confirmed during this session.
+_KNOWN_DIRS: set[str] = set()
+
+# Best-effort record of the last version exported per (character, scene) in this
+# session. Other machines may write versions too; reserve_export_file() catches that.
+_VERSION_CACHE: dict[tuple[str, str], int] = {}
 
 def get_next_version(export_path: str, character: str, scene: str) -> int:
     """
@@ -48,15 +46,133 @@ def get_next_version(export_path: str, character: str, scene: str) -> int:
     Returns:
         int: The next available version number for the export file.
     """
-    existing_files = [
-        f for f in os.listdir(export_path)
-        if f.startswith(f"{character}_{scene}_v")
-    ]
-    version_numbers = [
-        int(file.split("_")[2][1:]) for file in existing_files if "_v" in file
-    ]
+    prefix: str = f"{character}_{scene}_v"
+    version_numbers: list[int] = []
+
+    with os.scandir(export_path) as entries:
+        for entry in entries:
+            if not entry.name.startswith(prefix):
+                continue
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            try:
+                version_numbers.append(int(entry.name[len(prefix):].partition(".")[0]))
+            except ValueError:
+                continue
+
     return max(version_numbers, default=0) + 1
 
+def reserve_export_file(export_path: str, character: str, scene: str, version: int) -> tuple[str, int]:
+    """
+    Atomically claims the export file name for the given version.
+
+    The file is created with O_EXCL, so a concurrent export that picked the
+    same version fails here instead of overwriting; the version is then
+    bumped and the claim retried.
+
+    Args:
+        export_path (str): The base directory for exports.
+        character (str): The selected character.
+        scene (str): The selected scene.
+        version (int): The version returned by get_next_version.
+
+    Returns:
+        tuple[str, int]: The reserved file path and its version number.
+    """
+    name_prefix: str = f"{export_path}/{character}_{scene}_v"
+    while True:
+        export_file_path = f"{name_prefix}{version}.fbx"
+        try:
+            os.close(os.open(export_file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            version += 1
+            continue
+        return export_file_path, version
+
+def resolve_export_target(base_path: str, character: str, scene: str) -> tuple[str, int]:
+    """
+    Ensures the export directory for a character and scene exists and finds the next version.
+
+    Args:
+        base_path (str): The root directory for animation exports.
+        character (str): The selected character.
+        scene (str): The selected scene.
+
+    Returns:
+        tuple[str, int]: The export directory and the next available version number.
+    """
+    export_path: str = f"{base_path}/{character}/{scene}"
+    key: tuple[str, str] = (character, scene)
+
+    if export_path not in _KNOWN_DIRS:
+        try:
+            os.makedirs(export_path)
+        except FileExistsError:
+            pass
+        else:
+            # A directory created just now holds no versions, so skip the scan.
+            _VERSION_CACHE[key] = 0
+        _KNOWN_DIRS.add(export_path)
+
+    cached: int | None = _VERSION_CACHE.get(key)
+    if cached is not None:
+        return export_path, cached + 1
+    return export_path, get_next_version(export_path, character, scene)
+
+def export_animation(character: str, scene: str) -> str:
+    """
+    Exports the selected armatures as the next version of the given character and scene.
+
+    The export directory is only scanned the first time a character and scene
+    are exported in a session; afterwards the cached version is continued.
+
+    Args:
+        character (str): The character to export.
+        scene (str): The scene to export.
+
+    Returns:
+        str: The path of the exported FBX file.
+
+    Raises:
+        RuntimeError: If the FBX exporter cancels the export.
+    """
+    export_path, version = resolve_export_target(BASE_PATH, character, scene)
+    export_file_path, version = reserve_export_file(export_path, character, scene, version)
+
+    # The reserved file is empty until the exporter writes it; remove it on
+    # failure so it is never picked up as the latest version.
+    try:
+        # Only armatures are written, so hand the exporter just those and keep
+        # selected meshes out of its scene traversal.
+        armatures = [obj for obj in bpy.context.selected_objects if obj.type == "ARMATURE"]
+        with bpy.context.temp_override(selected_objects=armatures):
+            result = bpy.ops.export_scene.fbx(
+                filepath=export_file_path,
+                use_selection=True,
+                apply_scale_options="FBX_SCALE_NONE",
+                bake_anim=True,
+                bake_anim_use_all_bones=True,
+                bake_anim_use_nla_strips=False,
+                bake_anim_use_all_actions=False,
+                bake_anim_force_startend_keying=True,
+                object_types={"ARMATURE"},
+                mesh_smooth_type="OFF",
+                use_armature_deform_only=False,
+                add_leaf_bones=False,
+                axis_forward="X",
+                axis_up="Z",
+                global_scale=1.0,
+            )
+        if "FINISHED" not in result:
+            raise RuntimeError(f"FBX export to {export_file_path} was cancelled")
+    except Exception:
+        with contextlib.suppress(OSError):
+            os.remove(export_file_path)
+        raise
+
+    _VERSION_CACHE[(character, scene)] = version
+    return export_file_path
+
 class ExportToFBXOperator(bpy.types.Operator):
     """
     Operator to export selected animations to FBX for Unreal Engine.
@@ -76,38 +192,16 @@ class ExportToFBXOperator(bpy.types.Operator):
             context (bpy.context): Blender's context object.
 
         Returns:
-            set: A set containing 'FINISHED' if the operation succeeds.
+            set: A set containing 'FINISHED' if the operation succeeds, 'CANCELLED' otherwise.
         """
         selected_character: str = context.scene.character_selector
         selected_scene: str = context.scene.scene_selector
 
-        base_path: str = "N:/GOLEMS_FATE/animations"
-        export_path: str = os.path.join(base_path, selected_character, selected_scene)
-
-        if not os.path.exists(export_path):
-            os.makedirs(export_path)
-
-        version: int = get_next_version(export_path, selected_character, selected_scene)
-        export_file_name: str = f"{selected_character}_{selected_scene}_v{version}.fbx"
-        export_file_path: str = os.path.join(export_path, export_file_name)
-
-        bpy.ops.export_scene.fbx(
-            filepath=export_file_path,
-            use_selection=True,
-            apply_scale_options="FBX_SCALE_NONE",
-            bake_anim=True,
-            bake_anim_use_all_bones=True,
-            bake_anim_use_nla_strips=False,
-            bake_anim_use_all_actions=False,
-            bake_anim_force_startend_keying=True,
-            object_types={"ARMATURE"},
-            mesh_smooth_type="OFF",
-            use_armature_deform_only=False,
-            add_leaf_bones=False,
-            axis_forward="X",
-            axis_up="Z",
-            global_scale=1.0,
-        )
+        try:
+            export_animation(selected_character, selected_scene)
+        except RuntimeError as e:
+            self.report({"ERROR"}, str(e))
+            return {"CANCELLED"}
 
         self.report(
             {"INFO"},
@@ -115,6 +209,72 @@ class ExportToFBXOperator(bpy.types.Operator):
         )
         return {"FINISHED"}
 
+class ExportBatchToFBXOperator(bpy.types.Operator):
+    """
+    Operator to export several characters and scenes in one run.
+
+    Meant to be called from scripts, e.g.:
+
+        bpy.ops.export_scene.fbx_unreal_batch(
+            pairs="Maurice/Szene 003/Maurice_rig,Bird/Szene 004/Bird_rig"
+        )
+
+    Characters and scenes are given by their identifiers in CHARACTER_OPTIONS
+    and SCENE_OPTIONS, as the panel stores them. Each entry names the armature
+    object to export for that character and scene, so every pair is written
+    from its own rig instead of the current selection. Each pair is exported
+    as its own versioned FBX file, exactly like the single export.
+    """
+    bl_idname = "export_scene.fbx_unreal_batch"
+    bl_label = "Batch Export to FBX for Unreal"
+
+    pairs: bpy.props.StringProperty(
+        name="Pairs",
+        description="Comma-separated character/scene/armature entries to export",
+        default="",
+    )
+
+    def execute(self, context: bpy.types.Context) -> set[str]:
+        """
+        Executes the export process for every character/scene pair.
+
+        Args:
+            context (bpy.context): Blender's context object.
+
+        Returns:
+            set: A set containing 'FINISHED' if all exports succeed, or 'CANCELLED'
+                if an entry is invalid or an export is cancelled.
+        """
+        characters = {item[0] for item in CHARACTER_OPTIONS}
+        scenes = {item[0] for item in SCENE_OPTIONS}
+
+        pairs: list[tuple[str, str, bpy.types.Object]] = []
+        for pair in self.pairs.split(","):
+            parts = pair.strip().split("/")
+            if len(parts) != 3 or not all(parts):
+                self.report({"ERROR"}, f"Invalid character/scene/armature entry: '{pair}'")
+                return {"CANCELLED"}
+            character, scene, armature_name = parts
+            if character not in characters or scene not in scenes:
+                self.report({"ERROR"}, f"Unknown character or scene in entry: '{pair}'")
+                return {"CANCELLED"}
+            armature = context.scene.objects.get(armature_name)
+            if armature is None or armature.type != "ARMATURE":
+                self.report({"ERROR"}, f"No armature named '{armature_name}' in the scene")
+                return {"CANCELLED"}
+            pairs.append((character, scene, armature))
+
+        for exported, (character, scene, armature) in enumerate(pairs):
+            try:
+                with context.temp_override(selected_objects=[armature]):
+                    export_animation(character, scene)
+            except RuntimeError as e:
+                self.report({"ERROR"}, f"{e} ({exported} of {len(pairs)} exported)")
+                return {"CANCELLED"}
+
+        self.report({"INFO"}, f"Exported {len(pairs)} animations to FBX successfully!")
+        return {"FINISHED"}
+
 class ExportFBXPanel(bpy.types.Panel):
     """
     UI Panel for exporting animations to FBX.
@@ -146,18 +306,30 @@ def register() -> None:
     Registers the operator and panel with Blender.
     """
     bpy.utils.register_class(ExportToFBXOperator)
+    bpy.utils.register_class(ExportBatchToFBXOperator)
     bpy.utils.register_class(ExportFBXPanel)
-    bpy.types.Scene.character_selector = bpy.props.EnumProperty(items=CHARACTER_OPTIONS)
-    bpy.types.Scene.scene_selector = bpy.props.EnumProperty(items=SCENE_OPTIONS)
+    bpy.types.Scene.character_selector = bpy.props.EnumProperty(
+        name="Select Character",
+        description="Choose the character for the animation export",
+        items=CHARACTER_OPTIONS,
+    )
+    bpy.types.Scene.scene_selector = bpy.props.EnumProperty(
+        name="Select Scene",
+        description="Choose the scene for the animation export",
+        items=SCENE_OPTIONS,
+    )
 
 def unregister() -> None:
     """
     Unregisters the operator and panel from Blender.
     """
     bpy.utils.unregister_class(ExportToFBXOperator)
+    bpy.utils.unregister_class(ExportBatchToFBXOperator)
     bpy.utils.unregister_class(ExportFBXPanel)
     del bpy.types.Scene.character_selector
     del bpy.types.Scene.scene_selector
+    _KNOWN_DIRS.clear()
+    _VERSION_CACHE.clear()
 
 if __name__ == "__main__":
     register()
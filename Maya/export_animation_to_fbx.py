@@ -3,8 +3,40 @@ import os
 
 # Third-party imports
 import maya.cmds as cmds
-import maya.mel as mel
-import pymel.core as pc
+
+
+# Export directories already created or confirmed during this session.
+_KNOWN_DIRS: set[str] = set()
+
+# Version sidecar files already checked against a directory scan during this session.
+_VERIFIED_SIDECARS: set[str] = set()
+
+# The FBX export flags are global to the Maya session, so they only need setting once.
+_FBX_CONFIGURED: bool = False
+
+
+def _configure_fbx() -> None:
+    """
+    Loads the FBX plugin if needed and sets the flags for animation-only, baked exports
+    once per session.
+    """
+    global _FBX_CONFIGURED
+    if _FBX_CONFIGURED:
+        return
+    import maya.mel as mel
+
+    if not cmds.pluginInfo("fbxmaya", query=True, loaded=True):
+        cmds.loadPlugin("fbxmaya")
+    mel.eval('FBXExportAnimationOnly -v true; FBXExportBakeComplexAnimation -v true;')
+    _FBX_CONFIGURED = True
+
+
+def reset_fbx_config() -> None:
+    """
+    Forces the FBX export flags to be set again on the next export.
+    """
+    global _FBX_CONFIGURED
+    _FBX_CONFIGURED = False
 
 
 def export_fbx(export_path: str, file_name: str) -> bool:
@@ -18,17 +50,25 @@ def export_fbx(export_path: str, file_name: str) -> bool:
     Returns:
         bool: True if the export was successful, False otherwise.
     """
-    if not os.path.exists(export_path):
-        os.makedirs(export_path)
-
-    full_path: str = os.path.join(export_path, file_name)
+    # execute() has already created the directory; only direct callers
+    # exporting to a new path need it made here.
+    if export_path not in _KNOWN_DIRS:
+        os.makedirs(export_path, exist_ok=True)
+        _KNOWN_DIRS.add(export_path)
 
+    full_path: str = f"{export_path}/{file_name}"
 
-    mel.eval('FBXExportAnimationOnly -v true;') 
-    mel.eval('FBXExportBakeComplexAnimation -v true;')
+    _configure_fbx()
 
     try:
-        pc.system.exportSelected(full_path, type="FBX export")
+        cmds.file(
+            full_path,
+            force=True,
+            options="v=0;",
+            type="FBX export",
+            preserveReferences=True,
+            exportSelected=True,
+        )
         print(f"Animation successfully exported as FBX to: {full_path}")
         return True
     except RuntimeError as e:
@@ -37,6 +77,50 @@ def export_fbx(export_path: str, file_name: str) -> bool:
 
 
 def get_next_version(export_path: str, base_name: str) -> int:
+    """
+    Determines the next version number for an export file.
+
+    Reads the last exported version from the ``<base_name>.version`` sidecar file.
+    The first lookup of a sidecar in each session is checked against a directory
+    scan, and a stale sidecar is rewritten with the scanned version, so it never
+    hands out an older version than exists on disk.
+    After that the directory is only scanned if the sidecar is missing or
+    unreadable, or if the version after it already exists (e.g. exported from
+    Blender).
+    
+    Args:
+        export_path (str): The directory to check for existing files.
+        base_name (str): The base name of the file (e.g., character_scene).
+    
+    Returns:
+        int: The next available version number.
+    """
+    sidecar_path: str = f"{export_path}/{base_name}.version"
+    try:
+        with open(sidecar_path, encoding="utf-8") as version_file:
+            version: int = int(version_file.read()) + 1
+    except (OSError, ValueError):
+        pass
+    else:
+        if sidecar_path not in _VERIFIED_SIDECARS:
+            scanned: int = scan_next_version(export_path, base_name)
+            if scanned > version:
+                # Write the reconciled version back so later lookups in this
+                # session do not fall back to the stale value.
+                try:
+                    save_version(export_path, base_name, scanned - 1)
+                except OSError as e:
+                    print(f"Failed to update the version sidecar: {e}")
+                    return scanned
+            _VERIFIED_SIDECARS.add(sidecar_path)
+            return max(version, scanned)
+        if not os.path.exists(f"{export_path}/{base_name}_v{version}.fbx"):
+            return version
+
+    return scan_next_version(export_path, base_name)
+
+
+def scan_next_version(export_path: str, base_name: str) -> int:
     """
     Determines the next version number for an export file based on existing files in the directory.
     
@@ -47,25 +131,66 @@ def get_next_version(export_path: str, base_name: str) -> int:
     Returns:
         int: The next available version number.
     """
-    files: list[str] = [
-        f for f in os.listdir(export_path)
-        if f.startswith(base_name) and f.endswith(".fbx")
-    ]
+    prefix: str = f"{base_name}_v"
     version_numbers: list[int] = []
 
-    for file in files:
-        parts: list[str] = file.split("_")
-        if len(parts) > 1 and parts[-1].startswith("v"):
+    with os.scandir(export_path) as entries:
+        for entry in entries:
+            if not entry.name.startswith(prefix) or not entry.name.endswith(".fbx"):
+                continue
+            if not entry.is_file(follow_symlinks=False):
+                continue
             try:
-                version: int = int(parts[-1][1:].split(".")[0])
+                version: int = int(entry.name[len(prefix):].partition(".")[0])
                 version_numbers.append(version)
             except ValueError:
-                print(f"It exists an invalid version format")
+                print(f"It exists an invalid version format: {entry.name}")
                 continue
 
     return max(version_numbers, default=0) + 1
 
 
+def save_version(export_path: str, base_name: str, version: int) -> None:
+    """
+    Records the last exported version in the ``<base_name>.version`` sidecar file.
+    The file is written to a temporary name first and swapped in with os.replace.
+
+    Args:
+        export_path (str): The directory the FBX file was exported to.
+        base_name (str): The base name of the file (e.g., character_scene).
+        version (int): The version number that was exported.
+    """
+    version_path: str = f"{export_path}/{base_name}.version"
+    temp_path: str = f"{version_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as version_file:
+        version_file.write(str(version))
+    os.replace(temp_path, version_path)
+
+
+def resolve_export_target(base_path: str, character: str, scene: str) -> tuple[str, int]:
+    """
+    Ensures the export directory for a character and scene exists and finds the next version.
+
+    Args:
+        base_path (str): The root directory for animation exports.
+        character (str): The name of the character to export.
+        scene (str): The name of the scene to export.
+
+    Returns:
+        tuple[str, int]: The export directory and the next available version number.
+
+    Raises:
+        OSError: If the export directory cannot be created.
+    """
+    export_path: str = f"{base_path}/{character}/{scene}"
+
+    if export_path not in _KNOWN_DIRS:
+        os.makedirs(export_path, exist_ok=True)
+        _KNOWN_DIRS.add(export_path)
+
+    return export_path, get_next_version(export_path, f"{character}_{scene}")
+
+
 def execute(scene: str, character: str) -> bool:
     """
     Executes the export process for the specified scene and character.
@@ -79,16 +204,58 @@ def execute(scene: str, character: str) -> bool:
         bool: True if the export was successful, False otherwise.
     """
     base_path: str = "N:/GOLEMS_FATE/animations"
-    export_path: str = os.path.join(base_path, character, scene)
-    print(f"Attempting to export to: {export_path}")
+    _configure_fbx()
 
     try:
-        os.makedirs(export_path, exist_ok=True)
+        export_path, version = resolve_export_target(base_path, character, scene)
     except OSError as e:
         print(f"Error creating directory: {e}")
         return False
 
-    version: int = get_next_version(export_path, f"{character}_{scene}")
+    print(f"Attempting to export to: {export_path}")
     file_name: str = f"{character}_{scene}_v{version}.fbx"
 
-    return export_fbx(export_path, file_name)
+    if not export_fbx(export_path, file_name):
+        return False
+
+    try:
+        save_version(export_path, f"{character}_{scene}", version)
+    except OSError as e:
+        print(f"Failed to record version {version}: {e}")
+    return True
+
+
+def export_fbx_batch(batch: dict[tuple[str, str], list[str]]) -> list[tuple[str, str]]:
+    """
+    Exports one FBX file per character and scene pair, each from its own set of nodes.
+    The nodes of a pair are selected before its export and the original selection is
+    restored afterwards. The FBX plugin is configured a single time for the whole batch.
+
+    Args:
+        batch (dict[tuple[str, str], list[str]]): The nodes to export, keyed by (character, scene).
+
+    Returns:
+        list[tuple[str, str]]: The (character, scene) pairs that were exported successfully.
+    """
+    _configure_fbx()
+    original_selection: list[str] = cmds.ls(selection=True, long=True)
+    succeeded: list[tuple[str, str]] = []
+
+    try:
+        for (character, scene), nodes in batch.items():
+            if not nodes:
+                print(f"Skipped {character} in {scene}: no nodes to export")
+                continue
+            cmds.select(nodes, replace=True)
+            if execute(scene, character):
+                succeeded.append((character, scene))
+            else:
+                print(f"Export failed for {character} in {scene}")
+    finally:
+        if original_selection:
+            cmds.select(original_selection, replace=True)
+        else:
+            cmds.select(clear=True)
+
+    print(f"Exported {len(succeeded)} of {len(batch)} animations: {succeeded}")
+    return succeeded
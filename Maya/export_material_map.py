@@ -3,99 +3,180 @@ from pathlib import Path
 import json
 
 # Third-party imports
-import pymel.core as pc
+import maya.api.OpenMaya as om
+import maya.cmds as cmds
 
 # Typing imports
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 
-def get_materials(shape: pc.nodetypes.Mesh) -> List[pc.nodetypes.ShadingEngine]:
+def get_materials(shapes: List[str]) -> Dict[str, List[str]]:
     """
-    Retrieves all materials connected to the provided shape node.
+    Retrieves all materials connected to the provided shape nodes.
+
+    The shading engines of each shape are listed first; their surface shaders
+    are then resolved in a single query for all shading engines at once.
     
     Args:
-        shape (Shape): The shape node to process.
+        shapes (List[str]): Full DAG paths of the shape nodes to process.
 
     Returns:
-        List[ShadingEngine]: A list of material nodes connected to the shape.
+        Dict[str, List[str]]: A mapping of each shape to the material nodes connected to it.
     """
-    shading_groups = shape.listConnections(type="shadingEngine")
-    materials = []
-    for sg in shading_groups:
-        materials.extend(sg.surfaceShader.listConnections())
-    return materials
-
-def get_file(material: pc.nodetypes.ShadingEngine, channel: str) -> Optional[str]:
+    shape_to_sgs: Dict[str, List[str]] = {
+        shape: cmds.listConnections(shape, type="shadingEngine") or [] for shape in shapes
+    }
+    shading_groups = list(dict.fromkeys(sg for sgs in shape_to_sgs.values() for sg in sgs))
+    if not shading_groups:
+        return {shape: [] for shape in shapes}
+
+    connections = cmds.listConnections(
+        [f"{sg}.surfaceShader" for sg in shading_groups],
+        source=True, destination=False, connections=True,
+    ) or []
+    sg_to_materials: Dict[str, List[str]] = {}
+    for plug, material in zip(connections[::2], connections[1::2]):
+        sg_to_materials.setdefault(plug.partition(".")[0], []).append(material)
+
+    return {
+        shape: [material for sg in sgs for material in sg_to_materials.get(sg, [])]
+        for shape, sgs in shape_to_sgs.items()
+    }
+
+def get_files(materials: List[str], channel_list: List[str]) -> Dict[str, Dict[str, Optional[str]]]:
     """
-    Gets the file path of a texture connected to a specified material channel.
+    Gets the file paths of the textures connected to the given channels of each material.
+
+    All file node connections of the materials are listed in a single query and
+    sorted into channels by their destination plug, so channels without a
+    texture cost nothing.
 
     Args:
-        material (ShadingEngine): The material node to check.
-        channel (str): The material channel to query (e.g., "baseColor").
+        materials (List[str]): The material nodes to check.
+        channel_list (List[str]): The material channels to query (e.g., "baseColor").
 
     Returns:
-        Optional[str]: The file path of the texture if found, otherwise None.
+        Dict[str, Dict[str, Optional[str]]]: A mapping of each material to its channels and
+        texture file paths, with None for channels without a texture.
     """
-    file_nodes = material.attr(channel).listConnections(type="file")
-    if file_nodes:
-        return file_nodes[0].attr("fileTextureName").get()
-    return None
+    file_maps: Dict[str, Dict[str, Optional[str]]] = {
+        material: dict.fromkeys(channel_list) for material in materials
+    }
+    if not materials:
+        return file_maps
+
+    connections = cmds.listConnections(
+        materials, type="file", source=True, destination=False, connections=True, plugs=True,
+    ) or []
+    # File nodes shared between materials are only queried once.
+    texture_paths: Dict[str, str] = {}
+    for material_plug, file_plug in zip(connections[::2], connections[1::2]):
+        material, _, channel = material_plug.partition(".")
+        file_map = file_maps.get(material)
+        if file_map is None or channel not in file_map or file_map[channel] is not None:
+            continue
+        file_node = file_plug.partition(".")[0]
+        if file_node not in texture_paths:
+            texture_paths[file_node] = cmds.getAttr(f"{file_node}.fileTextureName")
+        file_map[channel] = texture_paths[file_node]
+
+    return file_maps
 
-def get_object_to_material_map(object_list: List[pc.nodetypes.Transform], channel_list: List[str]) -> Dict[str, Dict[str, Optional[str]]]:
+def get_object_to_material_map(object_list: List[str], channel_list: List[str]) -> Dict[str, Dict[str, Optional[str]]]:
     """
     Generates a dictionary mapping objects to their materials and associated textures.
     
     Args:
-        object_list (List[Transform]): List of transform nodes representing objects.
+        object_list (List[str]): Full DAG paths of the transform nodes representing objects.
         channel_list (List[str]): List of material channels to query.
 
     Returns:
         Dict[str, Dict[str, Optional[str]]]: A mapping of object names to their materials and texture file paths.
     """
-    object_to_material_map: Dict[str, Dict[str, Optional[str]]] = {}
-    used_shader = set()
+    shapes = cmds.listRelatives(object_list, shapes=True, noIntermediate=True, fullPath=True) or []
+    object_to_shape: Dict[str, str] = {}
+    for shape in shapes:
+        object_to_shape.setdefault(shape.rpartition("|")[0], shape)
 
+    shape_to_materials = get_materials(list(dict.fromkeys(object_to_shape.values())))
+
+    object_to_material: Dict[str, str] = {}
     for obj in object_list:
-        shape = obj.getShape()
-        if not shape:
-            continue
+        materials = shape_to_materials.get(object_to_shape.get(obj), [])
+        if materials:
+            object_to_material[obj] = materials[0]
 
-        materials = get_materials(shape)
-        if not materials:
-            continue
+    file_maps = get_files(list(dict.fromkeys(object_to_material.values())), channel_list)
+
+    object_to_material_map: Dict[str, Dict[str, Optional[str]]] = {}
+    used_shader: Set[str] = set()
 
-        material = materials[0]
+    for obj, material in object_to_material.items():
         if material not in used_shader:
-            file_map = {
-                channel: get_file(material, channel) for channel in channel_list
-            }
-            object_to_material_map[obj.name()] = file_map
-            used_shader.add(material)  
+            object_to_material_map[cmds.ls(obj)[0]] = file_maps[material]
+            used_shader.add(material)
 
     return object_to_material_map
 
-def get_selected_objects() -> Optional[List[pc.nodetypes.Transform]]:
+def get_selected_objects(recursive: bool = True) -> Optional[List[str]]:
     """
     Retrieves all visible objects under the selected group in the scene.
 
+    Walks the selected hierarchies with an OpenMaya DAG iterator so that no
+    PyMEL nodes are created for the (possibly thousands of) meshes below them.
+
+    Args:
+        recursive (bool): If False, only the selected nodes and their direct
+            children are considered instead of the whole hierarchy.
+
     Returns:
-        Optional[List[Transform]]: A list of transform nodes for all visible objects in the group.
+        Optional[List[str]]: Full DAG paths of the transform nodes for all visible objects in the group.
     """
-    sel = pc.selected()
-    if not sel:
-        pc.warning("Please select a top-level group.")
+    selection = om.MGlobal.getActiveSelectionList()
+    if selection.isEmpty():
+        cmds.warning("Please select a top-level group.")
         return None
+
+    if not recursive:
+        return get_direct_children(cmds.ls(selection=True, long=True))
         
     output = []
+    dag_iter = om.MItDag(om.MItDag.kDepthFirst, om.MFn.kMesh)
     
-    for elem in sel:
-        all_transforms = [
-            obj.getParent() for obj in elem.getChildren(ad=True, type="mesh") if not obj.intermediateObject.get()
-        ]
-        filtered_transforms = [obj for obj in all_transforms if obj.visibility.get()]
-        output.extend(filtered_transforms)
+    for i in range(selection.length()):
+        try:
+            root = selection.getDagPath(i)
+        except (TypeError, RuntimeError):
+            continue  # Not a DAG node, nothing to traverse.
+
+        dag_iter.reset(root, om.MItDag.kDepthFirst, om.MFn.kMesh)
+        while not dag_iter.isDone():
+            mesh_path = dag_iter.getPath()
+            dag_iter.next()
+            if om.MFnDagNode(mesh_path).isIntermediateObject:
+                continue
+            transform_path = om.MDagPath(mesh_path).pop()
+            if om.MFnDagNode(transform_path).findPlug("visibility", False).asBool():
+                output.append(transform_path.fullPathName())
 
     return output
 
+def get_direct_children(selected: List[str]) -> List[str]:
+    """
+    Retrieves the visible mesh transforms among the selected nodes and their direct children.
+
+    Args:
+        selected (List[str]): Full DAG paths of the selected nodes.
+
+    Returns:
+        List[str]: Full DAG paths of the visible transforms that have a non-intermediate mesh.
+    """
+    children = cmds.listRelatives(selected, children=True, type="transform", fullPath=True) or []
+    shapes = cmds.listRelatives(
+        selected + children, shapes=True, type="mesh", noIntermediate=True, fullPath=True
+    ) or []
+    transforms = dict.fromkeys(shape.rpartition("|")[0] for shape in shapes)
+    return [transform for transform in transforms if cmds.getAttr(f"{transform}.visibility")]
+
 def save_to_json(data: Dict[str, Dict[str, Optional[str]]], path: str) -> None:
     """
     Saves the provided data to a JSON file at the specified path.
@@ -104,22 +185,24 @@ def save_to_json(data: Dict[str, Dict[str, Optional[str]]], path: str) -> None:
         data (Dict[str, Dict[str, Optional[str]]]): The data to save.
         path (str): The file path to save the data to.
     """
-    path = Path(path)
-    path.write_text(json.dumps(data, indent=4))
+    with Path(path).open("w", encoding="utf-8") as json_file:
+        json.dump(data, json_file, indent=4)
 
-def execute(output_path: str) -> bool:
+def execute(output_path: str, recursive: bool = True) -> bool:
     """
     Main function to execute the script: get selected objects, extract material data, and save it to a JSON file.
 
     Args:
         output_path (str): Path to save the exported data.
+        recursive (bool): Whether to collect objects from the whole selected hierarchy
+            or only from the direct children of the selection.
 
     Returns:
         bool: True if the process was successful, False if an error occurred.
     """
-    selected_objects = get_selected_objects()
+    selected_objects = get_selected_objects(recursive)
     if not selected_objects:
-        pc.warning("No objects selected. Please select at least one object.")
+        cmds.warning("No objects selected. Please select at least one object.")
         return False
     
     channels: List[str] = ["baseColor", "opacity", "normalCamera", "metalness", "specularRoughness"]
@@ -127,6 +210,6 @@ def execute(output_path: str) -> bool:
     object_to_material_map = get_object_to_material_map(selected_objects, channels)
 
     save_to_json(object_to_material_map, output_path)
-    pc.confirmDialog(title="Success", message=f"Data exported to {output_path}", button=["OK"])
+    cmds.confirmDialog(title="Success", message=f"Data exported to {output_path}", button=["OK"])
 
     return True
@@ -2,16 +2,15 @@
 from typing import Optional
 
 # Third-party imports
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QComboBox, 
-    QPushButton, QHBoxLayout, QMessageBox, QMainWindow
+    QPushButton, QHBoxLayout, QMessageBox, QMainWindow, QListWidget
 )
-from PySide6.QtCore import Qt
-from shiboken6 import wrapInstance
-import maya.OpenMayaUI as omui
 
-# Local application imports
-import export_animation_to_fbx as export
+
+_SCENES: tuple[str, ...] = tuple(f"Szene{i:03}" for i in range(1, 21))
+_CHARACTERS: tuple[str, ...] = ("Maurice", "Golem_Mother", "Bird", "Test")
 
 
 class MyWidget(QWidget):
@@ -34,15 +33,31 @@ class MyWidget(QWidget):
 
         self.scene_dropdown = QComboBox()
         self.scene_dropdown.addItem("Please select a scene")  # Placeholder option
-        for i in range(1, 21):
-            self.scene_dropdown.addItem(f"Szene{i:03}")
+        self.scene_dropdown.addItems(_SCENES)
         main_layout.addWidget(self.scene_dropdown)
 
         self.character_dropdown = QComboBox()
         self.character_dropdown.addItem("Please select a character")  # Placeholder option
-        self.character_dropdown.addItems(["Maurice", "Golem_Mother", "Bird", "Test"])
+        self.character_dropdown.addItems(_CHARACTERS)
         main_layout.addWidget(self.character_dropdown)
 
+        # Pairs queued for a batch export, each with the nodes selected when it was added.
+        self._batch: dict[tuple[str, str], list[str]] = {}
+        self.batch_list = QListWidget()
+        main_layout.addWidget(self.batch_list)
+
+        batch_layout = QHBoxLayout()
+
+        add_button = QPushButton("Add Selection to Batch")
+        add_button.clicked.connect(self.clicked_add_button)
+        batch_layout.addWidget(add_button)
+
+        batch_export_button = QPushButton("Export Batch")
+        batch_export_button.clicked.connect(self.clicked_batch_export_button)
+        batch_layout.addWidget(batch_export_button)
+
+        main_layout.addLayout(batch_layout)
+
         h_layout = QHBoxLayout()
 
         export_button = QPushButton("Export")
@@ -58,20 +73,37 @@ class MyWidget(QWidget):
         main_layout.setSpacing(10)
         self.setLayout(main_layout)
 
-    def clicked_export_button(self) -> None:
+    def selected_pair(self) -> Optional[tuple[str, str]]:
         """
-        Handles the export button click event.
-        Validates selections and initiates the export process.
+        Returns the scene and character chosen in the dropdowns.
+        Warns the user if either is still on its placeholder option.
+
+        Returns:
+            Optional[tuple[str, str]]: The (scene, character) pair, or None if the selection is incomplete.
         """
         selected_scene = self.scene_dropdown.currentText()
         selected_character = self.character_dropdown.currentText()
 
         if selected_scene == "Please select a scene" or selected_character == "Please select a character":
             QMessageBox.warning(self, "Invalid Selection", "Please select both a scene and a character before exporting.")
+            return None
+        return selected_scene, selected_character
+
+    def clicked_export_button(self) -> None:
+        """
+        Handles the export button click event.
+        Validates selections and initiates the export process.
+        """
+        pair = self.selected_pair()
+        if pair is None:
             return
+        selected_scene, selected_character = pair
 
         print(f"Exported: Scene = {selected_scene}, Character = {selected_character}")
 
+        # Imported here so that loading this module does not pull in the exporter.
+        import export_animation_to_fbx as export
+
         check = export.execute(selected_scene, selected_character)
         if check:
             QMessageBox.information(
@@ -90,6 +122,57 @@ class MyWidget(QWidget):
                 QMessageBox.Ok
             )
 
+    def clicked_add_button(self) -> None:
+        """
+        Handles the add button click event.
+        Queues the chosen character and scene with the nodes currently selected in Maya.
+        """
+        pair = self.selected_pair()
+        if pair is None:
+            return
+        selected_scene, selected_character = pair
+
+        import maya.cmds as cmds
+
+        nodes = cmds.ls(selection=True, long=True)
+        if not nodes:
+            QMessageBox.warning(self, "Empty Selection", "Please select the rig to export for this pair.")
+            return
+
+        key = (selected_character, selected_scene)
+        if key not in self._batch:
+            self.batch_list.addItem(f"{selected_character} - {selected_scene}")
+        self._batch[key] = nodes
+
+    def clicked_batch_export_button(self) -> None:
+        """
+        Handles the batch export button click event.
+        Exports every queued pair from its own nodes and reports which ones failed.
+        """
+        if not self._batch:
+            QMessageBox.warning(self, "Empty Batch", "Please add at least one pair to the batch.")
+            return
+
+        import export_animation_to_fbx as export
+
+        succeeded = export.export_fbx_batch(self._batch)
+        failed = [pair for pair in self._batch if pair not in succeeded]
+        if not failed:
+            QMessageBox.information(
+                self,
+                "Export Successful",
+                f"All {len(succeeded)} exports were successful!",
+                QMessageBox.Ok
+            )
+            self.parentWidget().close()
+        else:
+            QMessageBox.warning(
+                self,
+                "Export Failed",
+                "Failed to export: " + ", ".join(f"{character} - {scene}" for character, scene in failed),
+                QMessageBox.Ok
+            )
+
     def clicked_cancel_button(self) -> None:
         """
         Handles the cancel button click event.
@@ -112,6 +195,9 @@ def maya_main_window() -> QWidget:
     Returns:
         QWidget: The main window of Maya wrapped as a Qt widget.
     """
+    from shiboken6 import wrapInstance
+    import maya.OpenMayaUI as omui
+
     main_window_ptr = omui.MQtUtil.mainWindow()
     return wrapInstance(int(main_window_ptr), QWidget)
 
@@ -130,6 +216,10 @@ class MyWindow(QMainWindow):
         """
         super(MyWindow, self).__init__(parent)
 
+        # A parented window is only hidden by close(); delete it so old
+        # windows do not pile up under the Maya main window.
+        self.setAttribute(Qt.WA_DeleteOnClose)
+
         self.setWindowTitle("Select Scene and Character")
         self.resize(500, 100)
 
@@ -137,13 +227,25 @@ class MyWindow(QMainWindow):
         self.setCentralWidget(widget)
 
 
+# The window opened by the last execute() call, closed before a new one is shown.
+_window: Optional[MyWindow] = None
+
+
 def execute() -> None:
     """
     Executes the main workflow: creating and displaying the window,
     and running the export process upon user interaction.
     """
+    global _window
     print("Application started")
+
+    if _window is not None:
+        try:
+            _window.close()
+        except RuntimeError:
+            pass  # The window was closed by the user and already deleted.
+
     parent = maya_main_window()
 
-    window = MyWindow(parent=parent)
-    window.show()
+    _window = MyWindow(parent=parent)
+    _window.show()
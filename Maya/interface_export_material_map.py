@@ -1,17 +1,24 @@
 # Standard library imports
+from functools import partial
 from typing import Optional
 
 # Third-party imports
-from PySide6.QtWidgets import QWidget, QPushButton, QMainWindow, QLineEdit, QHBoxLayout, QVBoxLayout, QLabel, QFileDialog
-from PySide6.QtCore import Qt, QTimer
-from shiboken6 import wrapInstance
-import maya.OpenMayaUI as omui
+from PySide6.QtWidgets import QWidget, QPushButton, QMainWindow, QLineEdit, QHBoxLayout, QVBoxLayout, QLabel, QFileDialog, QCheckBox
+from PySide6.QtCore import Qt, QTimer, Signal
 
 # Local application imports
 import export_material_map as export
 
 
+_STYLE_SHEET: str = (
+    'QPushButton[highlight="true"] { background-color: #a0bdb8; }'
+    'QLabel[placeholder="true"] { font-style: italic; color: gray; }'
+)
+
+
 class Widget(QWidget):
+    close_requested = Signal()
+
     def __init__(self) -> None:
         """
         Initializes the widget with UI components such as buttons, labels, and layouts.
@@ -20,14 +27,20 @@ class Widget(QWidget):
 
         self.setWindowTitle("Title")
         self.setMinimumWidth(500)
+        self.setStyleSheet(_STYLE_SHEET)
+
+        self._selected_path: Optional[str] = None
 
         info_label = QLabel("Select a destination:")
         self.destination_label = QLabel("Nothing selected")
-        self.destination_label.setStyleSheet("font-style: italic; color: gray;")
+        self.destination_label.setProperty("placeholder", True)
 
         self.open_explorer_button = QPushButton("Open Explorer")
         self.open_explorer_button.clicked.connect(self.button_clicked)
 
+        self.recursive_checkbox = QCheckBox("Recurse into subgroups")
+        self.recursive_checkbox.setChecked(True)
+
         done_button = QPushButton("Done")
         done_button.clicked.connect(self.done_button_clicked)
 
@@ -43,6 +56,7 @@ class Widget(QWidget):
         v_layout.addWidget(info_label)
         v_layout.addWidget(self.destination_label)
         v_layout.addWidget(self.open_explorer_button)
+        v_layout.addWidget(self.recursive_checkbox)
         v_layout.addLayout(h_layout)
 
         v_layout.setAlignment(Qt.AlignTop)
@@ -53,37 +67,53 @@ class Widget(QWidget):
         """
         Opens a file dialog to select a save location for the JSON file.
         """
-        file_path, _ = QFileDialog.getSaveFileName(self, "Save File", "", "JSON Files (*.json)")
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Save File",
+            "",
+            "JSON Files (*.json)",
+            options=QFileDialog.DontUseNativeDialog | QFileDialog.DontUseCustomDirectoryIcons
+        )
+
+        self._selected_path = file_path or None
 
         if file_path:
             self.destination_label.setText(file_path)
-            self.destination_label.setStyleSheet("") 
+            self.set_style_state(self.destination_label, "placeholder", False)
         else:
             self.destination_label.setText("Nothing selected")
-            self.destination_label.setStyleSheet("font-style: italic; color: gray;")
+            self.set_style_state(self.destination_label, "placeholder", True)
             
     def cancel_button_clicked(self) -> None:
         """
         Closes the parent window when the cancel button is clicked.
         """
-        parent = self.parentWidget()
-        if parent:
-            parent.close()
+        self.close_requested.emit()
 
     def done_button_clicked(self) -> None:
         """
         Executes the action of saving the data to the selected path when the done button is clicked.
         """
-        parent = self.parentWidget()
-        output_path = self.destination_label.text()
-
-        if self.destination_label.text() == "Nothing selected":
+        if self._selected_path is None:
             self.highlight_button(self.open_explorer_button)
             print("No destination selected.")
         else:
-            print(f"Destination set to: {self.destination_label.text()}")
-            if export.execute(output_path):
-                parent.close()
+            print(f"Destination set to: {self._selected_path}")
+            if export.execute(self._selected_path, self.recursive_checkbox.isChecked()):
+                self.close_requested.emit()
+
+    def set_style_state(self, widget: QWidget, name: str, value: bool) -> None:
+        """
+        Toggles a dynamic property used by the widget's style sheet and restyles only that widget.
+
+        Args:
+            widget (QWidget): The widget to restyle.
+            name (str): The name of the dynamic property.
+            value (bool): The new value of the property.
+        """
+        widget.setProperty(name, value)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
 
     def reset_button(self, button: QPushButton) -> None:
         """
@@ -92,7 +122,7 @@ class Widget(QWidget):
         Args:
             button (QPushButton): The button whose appearance needs to be reset.
         """
-        button.setStyleSheet("")
+        self.set_style_state(button, "highlight", False)
         
     def highlight_button(self, button: QPushButton) -> None:
         """
@@ -101,9 +131,9 @@ class Widget(QWidget):
         Args:
             button (QPushButton): The button to highlight.
         """
-        button.setStyleSheet("background-color: #a0bdb8;")
+        self.set_style_state(button, "highlight", True)
 
-        QTimer.singleShot(500, lambda: self.reset_button(button))
+        QTimer.singleShot(500, partial(self.reset_button, button))
 
 
 def maya_main_window() -> QWidget:
@@ -113,6 +143,9 @@ def maya_main_window() -> QWidget:
     Returns:
         QWidget: The main window of Maya wrapped as a Qt widget.
     """
+    from shiboken6 import wrapInstance
+    import maya.OpenMayaUI as omui
+
     main_window_ptr = omui.MQtUtil.mainWindow()
     return wrapInstance(int(main_window_ptr), QWidget)
 
@@ -131,6 +164,7 @@ class MyWindow(QMainWindow):
         self.resize(500, 100)
 
         widget = Widget()
+        widget.close_requested.connect(self.close)
         self.setCentralWidget(widget)
 
 
@@ -1,7 +1,11 @@
 import unreal
 import os
 import re
-from typing import List, Optional
+from typing import List, Optional, Set
+
+
+_VERSION_RE = re.compile(r"v(\d+)(?=\.\w+$)")
+_VERSION_STRIP_RE = re.compile(r"_v\d+$")
 
 
 def extract_version(filename: str) -> int:
@@ -14,7 +18,7 @@ def extract_version(filename: str) -> int:
     Returns:
         int: The version number if found, otherwise -1.
     """
-    match = re.search(r"v(\d+)(?=\.\w+$)", filename)
+    match = _VERSION_RE.search(filename)
     return int(match.group(1)) if match else -1
 
 
@@ -28,13 +32,9 @@ def find_latest_version(files: List[str]) -> Optional[str]:
     Returns:
         str or None: The file name of the latest version, or None if no versioned files are found.
     """
-    latest_file = None
-    highest_version = -1
-    for file in files:
-        version = extract_version(file)
-        if version > highest_version:
-            highest_version = version
-            latest_file = file
+    latest_file = max(files, key=extract_version, default=None)
+    if latest_file is None or extract_version(latest_file) < 0:
+        return None
     return latest_file
 
 
@@ -47,72 +47,126 @@ def create_unreal_folders(source_path: str, unreal_base_path: str) -> None:
         source_path (str): The root folder on the disk containing the assets.
         unreal_base_path (str): The base folder path in Unreal where assets will be imported.
     """
-    for character_folder in os.listdir(source_path):
-        character_path = os.path.join(source_path, character_folder)
-        if os.path.isdir(character_path):
-            character_unreal_path = f"{unreal_base_path}/{character_folder}"
-            create_folder_if_not_exists(character_unreal_path)
-            
-            for scene_folder in os.listdir(character_path):
-                scene_path = os.path.join(character_path, scene_folder)
-                if os.path.isdir(scene_path):
-                    scene_unreal_path = f"{character_unreal_path}/{scene_folder}"
-                    create_folder_if_not_exists(scene_unreal_path)
-
-                    animation_files = [f for f in os.listdir(scene_path) if f.endswith(".fbx")]
+    import_ui = create_fbx_import_options()
+    pending_tasks: List[unreal.AssetImportTask] = []
+
+    # Query the asset registry once instead of once per folder and file.
+    asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    existing_assets: Set[str] = {
+        str(asset.package_name)
+        for asset in asset_registry.get_assets_by_path(unreal_base_path, recursive=True)
+    }
+    existing_folders: Set[str] = {str(path) for path in asset_registry.get_sub_paths(unreal_base_path, True)}
+
+    with os.scandir(source_path) as character_entries:
+        for character_entry in character_entries:
+            if not character_entry.is_dir():
+                continue
+            character_unreal_path = f"{unreal_base_path}/{character_entry.name}"
+            create_folder_if_not_exists(character_unreal_path, existing_folders)
+
+            with os.scandir(character_entry.path) as scene_entries:
+                for scene_entry in scene_entries:
+                    if not scene_entry.is_dir():
+                        continue
+                    scene_unreal_path = f"{character_unreal_path}/{scene_entry.name}"
+                    create_folder_if_not_exists(scene_unreal_path, existing_folders)
+
+                    with os.scandir(scene_entry.path) as file_entries:
+                        animation_files = [f.name for f in file_entries if f.name.endswith(".fbx")]
                     latest_file = find_latest_version(animation_files)
                     if latest_file:
-                        animation_path = os.path.join(scene_path, latest_file)
+                        animation_path = os.path.join(scene_entry.path, latest_file)
                         unreal_asset_path = f"{scene_unreal_path}/{latest_file[:-4]}"
-                        if not unreal.EditorAssetLibrary.does_asset_exist(unreal_asset_path):
-                            import_fbx_to_unreal(scene_unreal_path, latest_file, animation_path)
+                        if unreal_asset_path not in existing_assets:
+                            pending_tasks.append(
+                                build_import_task(scene_unreal_path, latest_file, animation_path, import_ui)
+                            )
                         else:
                             print(f"Latest version already imported: {latest_file}")
 
+    import_fbx_to_unreal(pending_tasks)
 
-def create_folder_if_not_exists(folder_path: str) -> None:
+
+def create_folder_if_not_exists(folder_path: str, existing_folders: Optional[Set[str]] = None) -> None:
     """
     Creates the specified folder in Unreal if it does not already exist.
     
     Args:
         folder_path (str): The path of the folder to create in Unreal.
+        existing_folders (Optional[Set[str]]): Known existing folders from an earlier asset registry
+            scan. If given, it is used instead of asking Unreal and updated with created folders.
     """
-    if not unreal.EditorAssetLibrary.does_directory_exist(folder_path):
+    if existing_folders is not None:
+        exists = folder_path in existing_folders
+    else:
+        exists = unreal.EditorAssetLibrary.does_directory_exist(folder_path)
+
+    if not exists:
         unreal.EditorAssetLibrary.make_directory(folder_path)
+        if existing_folders is not None:
+            existing_folders.add(folder_path)
         print(f"Folder created: {folder_path}")
     else:
         print(f"Folder already exists: {folder_path}")
 
 
-def import_fbx_to_unreal(unreal_asset_path: str, animation_file: str, fbx_file_path: str) -> None:
+def create_fbx_import_options() -> unreal.FbxImportUI:
+    """
+    Creates the FBX import options shared by all animation import tasks.
+
+    Returns:
+        unreal.FbxImportUI: The configured import options.
+    """
+    import_ui = unreal.FbxImportUI()
+    import_ui.set_editor_property("import_as_skeletal", False)
+    import_ui.set_editor_property("import_materials", True)
+    import_ui.set_editor_property("import_textures", True)
+    import_ui.set_editor_property("import_mesh", True)
+    return import_ui
+
+
+def build_import_task(unreal_asset_path: str, animation_file: str, fbx_file_path: str,
+                      import_ui: unreal.FbxImportUI) -> unreal.AssetImportTask:
     """
-    Imports the specified FBX file into Unreal and removes the versioning from the asset name.
+    Builds the import task for the specified FBX file and removes the versioning from the asset name.
     
     Args:
         unreal_asset_path (str): The path in Unreal where the asset should be imported.
         animation_file (str): The name of the FBX file to import.
         fbx_file_path (str): The file path to the FBX file on disk.
+        import_ui (unreal.FbxImportUI): The FBX import options to use.
+
+    Returns:
+        unreal.AssetImportTask: The import task, not yet executed.
     """
-    base_name = re.sub(r"_v\d+$", "", animation_file[:-4]) 
+    base_name = _VERSION_STRIP_RE.sub("", animation_file[:-4])
 
     task = unreal.AssetImportTask()
     task.filename = fbx_file_path  
     task.destination_path = unreal_asset_path
     task.destination_name = f"anim_{base_name}"  
     task.replace_existing = True 
+    task.options = import_ui
 
-    import_ui = unreal.FbxImportUI()
-    import_ui.set_editor_property("import_as_skeletal", False)
-    import_ui.set_editor_property("import_materials", True)
-    import_ui.set_editor_property("import_textures", True)
-    import_ui.set_editor_property("import_mesh", True)
+    return task
 
-    task.options = import_ui
+
+def import_fbx_to_unreal(tasks: List[unreal.AssetImportTask]) -> None:
+    """
+    Imports all given FBX import tasks into Unreal in a single batch.
+    
+    Args:
+        tasks (List[unreal.AssetImportTask]): The import tasks to execute.
+    """
+    if not tasks:
+        return
 
     asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
-    asset_tools.import_asset_tasks([task])
+    asset_tools.import_asset_tasks(tasks)
 
-    print(f"Import complete: {fbx_file_path} as {task.destination_name} into {unreal_asset_path}")
+    for task in tasks:
+        print(f"Import complete: {task.filename} as {task.destination_name} into {task.destination_path}")
 
 
 if __name__ == "__main__":
@@ -2,11 +2,18 @@ import json
 import os
 from pathlib import Path
 import unreal
-from tkinter import Tk, Label, Button, filedialog, simpledialog
-from tkinter.ttk import *
-from typing import Dict, Optional
+from PySide6.QtWidgets import (
+    QApplication, QDialog, QDialogButtonBox, QFileDialog, QFormLayout, QLineEdit, QMessageBox
+)
+from typing import Dict, List, Optional
 
 
+_ASSET_TOOLS = unreal.AssetToolsHelpers.get_asset_tools()
+_ASSET_LIB = unreal.EditorAssetLibrary
+_MAT_LIB = unreal.MaterialEditingLibrary
+_TEXTURE_SAMPLE = unreal.MaterialExpressionTextureSample
+_SAMPLER_TYPE_NORMAL = unreal.MaterialSamplerType.SAMPLERTYPE_NORMAL
+
 def get_material_map(path: Path) -> Dict:
     """
     Loads the material mapping from a JSON file.
@@ -17,7 +24,7 @@ def get_material_map(path: Path) -> Dict:
     Returns:
         dict: The material map loaded from the JSON file.
     """
-    return json.load(path.open())
+    return json.loads(path.read_bytes())
 
 
 def get_file_location(object: str, channel: str, object_to_material_map: Dict[str, Dict[str, str]]) -> Optional[str]:
@@ -32,12 +39,7 @@ def get_file_location(object: str, channel: str, object_to_material_map: Dict[st
     Returns:
         str: The file path corresponding to the object and channel, or None if not found.
     """
-    for obj, channel_map in object_to_material_map.items():
-        if object == obj:
-            for chan, file in channel_map.items():
-                if channel == chan:
-                    return file
-    return None
+    return object_to_material_map.get(object, {}).get(channel)
 
 
 def create_material(asset_name: str, package_path: str) -> Optional[unreal.Material]:
@@ -52,9 +54,8 @@ def create_material(asset_name: str, package_path: str) -> Optional[unreal.Mater
         unreal.Material: The created material asset, or None if creation failed.
     """
     material_factory = unreal.MaterialFactoryNew()
-    asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
 
-    new_material = asset_tools.create_asset(
+    new_material = _ASSET_TOOLS.create_asset(
         asset_name=asset_name,
         package_path=package_path,
         asset_class=unreal.Material,
@@ -63,41 +64,66 @@ def create_material(asset_name: str, package_path: str) -> Optional[unreal.Mater
 
     if new_material:
         new_material.set_editor_property("two_sided", True)
-        unreal.EditorAssetLibrary.save_loaded_asset(new_material)
         return new_material
     else:
         print("Error: Material creation failed.")
         return None
 
 
-def import_texture(file_path: Path, destination_path: str) -> Optional[unreal.Texture]:
+def build_texture_import_task(file_path: Path, destination_path: str) -> unreal.AssetImportTask:
     """
-    Imports a texture from the specified file path into Unreal Engine.
+    Builds an automated import task for a texture without running it.
 
     Args:
         file_path (Path): The file path of the texture to import.
         destination_path (str): The Unreal Engine content path for the texture.
 
     Returns:
-        unreal.Texture: The imported texture asset, or None if import failed.
+        unreal.AssetImportTask: The configured import task.
     """
     task = unreal.AssetImportTask()
     task.set_editor_property("filename", str(file_path))
     task.set_editor_property("destination_path", destination_path)
     task.set_editor_property("replace_existing", True)
     task.set_editor_property("automated", True)
+    return task
+
 
-    unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks([task])
+def load_imported_texture(task: unreal.AssetImportTask) -> Optional[unreal.Texture]:
+    """
+    Loads the texture produced by an executed import task.
 
+    Args:
+        task (unreal.AssetImportTask): The executed import task.
+
+    Returns:
+        unreal.Texture: The imported texture asset, or None if import failed.
+    """
     imported_asset = task.get_editor_property("imported_object_paths")
     if imported_asset:
-        imported_texture = unreal.EditorAssetLibrary.load_asset(imported_asset[0])
+        imported_texture = _ASSET_LIB.load_asset(imported_asset[0])
         return imported_texture
     else:
-        print(f"Error: Texture '{file_path}' import failed.")
+        print(f"Error: Texture '{task.get_editor_property('filename')}' import failed.")
         return None
 
 
+def import_texture(file_path: Path, destination_path: str) -> Optional[unreal.Texture]:
+    """
+    Imports a texture from the specified file path into Unreal Engine.
+
+    Args:
+        file_path (Path): The file path of the texture to import.
+        destination_path (str): The Unreal Engine content path for the texture.
+
+    Returns:
+        unreal.Texture: The imported texture asset, or None if import failed.
+    """
+    task = build_texture_import_task(file_path, destination_path)
+    _ASSET_TOOLS.import_asset_tasks([task])
+    return load_imported_texture(task)
+
+
 def add_one_texture_to_material(material: unreal.Material, texture: unreal.Texture, channel: unreal.MaterialProperty) -> None:
     """
     Adds a single texture to a material at the specified channel.
@@ -107,16 +133,15 @@ def add_one_texture_to_material(material: unreal.Material, texture: unreal.Textu
         texture (unreal.Texture): The texture to add.
         channel (unreal.MaterialProperty): The material property to which the texture will be connected.
     """
-    editor_subsystem = unreal.MaterialEditingLibrary
-    texture_sample = editor_subsystem.create_material_expression(
+    texture_sample = _MAT_LIB.create_material_expression(
         material,
-        unreal.MaterialExpressionTextureSample,
+        _TEXTURE_SAMPLE,
     )
     texture_sample.texture = texture
 
     if channel == unreal.MaterialProperty.MP_NORMAL:
-        texture_sample.sampler_type = unreal.MaterialSamplerType.SAMPLERTYPE_NORMAL
-    editor_subsystem.connect_material_property(texture_sample, "RGB", channel)
+        texture_sample.sampler_type = _SAMPLER_TYPE_NORMAL
+    _MAT_LIB.connect_material_property(texture_sample, "RGB", channel)
 
 
 def remap_channels(data: Dict[str, Dict[str, str]], remap_dict: Dict[str, unreal.MaterialProperty]) -> Dict[str, Dict[str, str]]:
@@ -130,39 +155,60 @@ def remap_channels(data: Dict[str, Dict[str, str]], remap_dict: Dict[str, unreal
     Returns:
         dict: The updated material map with remapped channels.
     """
-    updated_data = {}
-    for obj, channels in data.items():
-        updated_channels = {}
-        for old_channel, texture_path in channels.items():
-            new_channel = remap_dict.get(old_channel)
-            if new_channel:
-                updated_channels[new_channel] = texture_path
-        updated_data[obj] = updated_channels
-    return updated_data
+    return {
+        obj: {
+            remap_dict[old_channel]: texture_path
+            for old_channel, texture_path in channels.items()
+            if old_channel in remap_dict
+        }
+        for obj, channels in data.items()
+    }
 
 
 def add_all_textures_to_material(material: unreal.Material, material_map: Dict[str, str]) -> None:
     """
     Adds all textures from the material map to the material.
+    All textures are imported in one batch before any of them is connected.
+    The material is recompiled once after all textures are connected; saving is left to the caller.
 
     Args:
         material (unreal.Material): The material to which textures will be added.
         material_map (dict): A mapping of channels to texture file paths.
     """
-    for channel, origin in material_map.items():
-        if origin:
-            destination = unreal.EditorAssetLibrary.get_path_name(material)
-            texture = import_texture(origin, destination)
+    destination = _ASSET_LIB.get_path_name(material)
+    channel_tasks = [
+        (channel, build_texture_import_task(origin, destination))
+        for channel, origin in material_map.items()
+        if origin
+    ]
+    if not channel_tasks:
+        return
+
+    _ASSET_TOOLS.import_asset_tasks([task for _, task in channel_tasks])
+
+    with unreal.ScopedEditorTransaction("Add textures"):
+        for channel, task in channel_tasks:
+            texture = load_imported_texture(task)
             if texture:
                 add_one_texture_to_material(material, texture, channel)
 
+    _MAT_LIB.recompile_material(material)
+
+
+def get_qt_app() -> QApplication:
+    """Returns the running Qt application, creating one if the editor has none yet."""
+    return QApplication.instance() or QApplication([])
+
 
 def select_json_file() -> Optional[str]:
     """Prompts the user to select a JSON file."""
-    json_file_path = filedialog.askopenfilename(
-        initialdir="N:/GOLEMS_FATE/character",
-        title="Select a JSON file",
-        filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")]
+    get_qt_app()
+    json_file_path, _ = QFileDialog.getOpenFileName(
+        None,
+        "Select a JSON file",
+        "N:/GOLEMS_FATE/character",
+        "JSON Files (*.json);;All Files (*.*)",
+        options=QFileDialog.DontUseNativeDialog | QFileDialog.DontUseCustomDirectoryIcons
     )
     if json_file_path:
         print("Selected JSON file:", json_file_path)
@@ -202,43 +248,60 @@ def get_user_input(object_to_material_map: Dict[str, Dict[str, str]]) -> tuple[P
     
     object_to_material_map = get_material_map(Path(json_file_path))
 
-    asset_names = {}
-    for obj in object_to_material_map.keys():
-        asset_name = simpledialog.askstring(
-            "Asset Name", f"Enter the name for the material of object '{obj}':"
-        )
+    asset_names = ask_asset_names(list(object_to_material_map.keys()))
+    if asset_names is None:
+        raise ValueError("Asset naming was canceled.")
+
+    for obj, asset_name in asset_names.items():
         if not asset_name:
             raise ValueError(f"No asset name provided for object '{obj}'.")
-        asset_names[obj] = asset_name
 
     return Path(json_file_path), asset_names, content_path
 
 
-def show_start_dialog() -> bool:
-    """
-    Displays a dialog asking the user if they want to proceed.
-    Returns True if the user agrees, False if they cancel.
+def ask_asset_names(objects: List[str]) -> Optional[Dict[str, str]]:
     """
-    # Initialize Tkinter window
-    root = Tk()
-    root.title("Choose a JSON File")
-    root.geometry("300x100")
-    user_choice = {"continue": False}
+    Asks for the material names of all objects in a single dialog.
 
-    def on_continue():
-        user_choice["continue"] = True
-        root.destroy()
+    Args:
+        objects (list): The object names from the material map.
 
-    def on_cancel():
-        user_choice["continue"] = False
-        root.destroy()
+    Returns:
+        dict: A mapping of object names to the entered material names, or None if the dialog was canceled.
+    """
+    get_qt_app()
+    dialog = QDialog()
+    dialog.setWindowTitle("Asset Names")
+
+    layout = QFormLayout(dialog)
+    name_fields = {}
+    for obj in objects:
+        name_fields[obj] = QLineEdit()
+        layout.addRow(f"Material name for '{obj}':", name_fields[obj])
+
+    buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+    buttons.accepted.connect(dialog.accept)
+    buttons.rejected.connect(dialog.reject)
+    layout.addRow(buttons)
+
+    if dialog.exec() != QDialog.Accepted:
+        return None
+    return {obj: field.text().strip() for obj, field in name_fields.items()}
 
-    Label(root, text="Please select a JSON file").pack(pady=10)
-    Button(root, text="Select File", command=on_continue).pack(side="left", padx=20)
-    Button(root, text="Cancel", command=on_cancel).pack(side="right", padx=20)
 
-    root.mainloop()
-    return user_choice["continue"]
+def show_start_dialog() -> bool:
+    """
+    Displays a dialog asking the user if they want to proceed.
+    Returns True if the user agrees, False if they cancel.
+    """
+    get_qt_app()
+    reply = QMessageBox.question(
+        None,
+        "Choose a JSON File",
+        "Please select a JSON file",
+        QMessageBox.Ok | QMessageBox.Cancel
+    )
+    return reply == QMessageBox.Ok
 
 
 def start_script() -> None:
@@ -271,6 +334,7 @@ def start_script() -> None:
             if material:
                 print(f"Material {asset_names[obj]} created for {obj}.")
                 add_all_textures_to_material(material, material_map)
+                _ASSET_LIB.save_loaded_asset(material)
     except Exception as e:
         unreal.log_error(f"An error occurred: {e}")
 